@@ -7,17 +7,18 @@ This script builds wheels and source distributions for GitHub releases.
 
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 def main():
     """Build distribution packages."""
     project_root = Path(__file__).parent.parent
-    
+
     print("=" * 80)
     print("Building Release Distribution Packages")
     print("=" * 80)
     print()
-    
+
     # Check if build is installed
     try:
         import build
@@ -25,33 +26,42 @@ def main():
         print("ERROR: 'build' package not installed.")
         print("Install it with: pip install build")
         sys.exit(1)
-    
-    # Clean previous builds
+
+    # Clean previous builds (both trees deleted concurrently)
     dist_dir = project_root / "dist"
     build_dir = project_root / "build"
-    
-    if dist_dir.exists():
-        print(f"Cleaning previous builds in {dist_dir}...")
-        import shutil
-        shutil.rmtree(dist_dir)
-    
-    if build_dir.exists():
-        print(f"Cleaning previous builds in {build_dir}...")
+
+    stale_dirs = [d for d in (dist_dir, build_dir) if d.exists()]
+    if stale_dirs:
         import shutil
-        shutil.rmtree(build_dir)
-    
+        with ThreadPoolExecutor(max_workers=len(stale_dirs)) as pool:
+            futures = []
+            for d in stale_dirs:
+                print(f"Cleaning previous builds in {d}...")
+                futures.append(pool.submit(shutil.rmtree, d))
+            # Surface any failed delete before building over a stale tree
+            for future in futures:
+                future.result()
+
     print()
     print("Building distribution packages...")
     print()
-    
-    # Build packages
+
+    # Build sdist and wheel concurrently - they are independent and each runs
+    # in its own isolated environment, so wall time is max() instead of sum()
     try:
-        result = subprocess.run(
-            [sys.executable, "-m", "build"],
-            cwd=project_root,
-            check=True
-        )
-        
+        procs = [
+            subprocess.Popen(
+                [sys.executable, "-m", "build", flag],
+                cwd=project_root,
+            )
+            for flag in ("--sdist", "--wheel")
+        ]
+        for proc in procs:
+            returncode = proc.wait()
+            if returncode != 0:
+                raise subprocess.CalledProcessError(returncode, proc.args)
+
         print()
         print("=" * 80)
         print("Build Complete!")
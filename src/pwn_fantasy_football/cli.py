@@ -18,8 +18,22 @@ if __name__ == "__main__":
 from pwn_fantasy_football import predict_fantasy_players, quick_predict
 
 
-def main():
-    """Main CLI entry point."""
+def _normalized_positions(top_players) -> list:
+    """Flatten the position column to plain strings.
+
+    Branches on the column dtype once instead of isinstance-checking every
+    row value.
+    """
+    import polars as pl
+
+    values = top_players.get_column('position').to_list()
+    if isinstance(top_players.schema['position'], pl.List):
+        return [p[0] if p else "UNK" for p in values]
+    return [str(p) if p is not None else "UNK" for p in values]
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    """Construct the CLI argument parser."""
     parser = argparse.ArgumentParser(
         description="Fantasy Football Prediction System - Unified Interface",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -116,8 +130,13 @@ Examples:
         action="store_true",
         help="Verbose output"
     )
-    
-    args = parser.parse_args()
+
+    return parser
+
+
+def main():
+    """Main CLI entry point."""
+    args = _build_parser().parse_args()
     
     # Set up logging level
     if args.verbose:
@@ -169,18 +188,26 @@ Examples:
         print("No players found matching criteria.")
         return
     
-    # Display top players
-    for idx, row in enumerate(results['top_players'].iter_rows(named=True), 1):
-        # Handle position if it's a list
-        position = row['position']
-        if isinstance(position, list):
-            position = position[0] if position else "UNK"
-        position = str(position)
-        
-        print(f"{idx:3d}. {row['player_name']:30s} ({position:2s}) "
-              f"| Predicted: {row['predicted_season_fp']:6.1f} FP "
-              f"| Avg/Game: {row['predicted_avg_fp_per_game']:5.2f} "
-              f"| Trend: {row['trend']:+.3f}")
+    # Display top players. Each column is materialized to Python once
+    # (columnar traversal) instead of a dict per row via iter_rows, and the
+    # lines are buffered and written in a single syscall instead of one
+    # print()/write() per row.
+    top_players = results['top_players']
+    names = top_players.get_column('player_name').to_list()
+    positions = _normalized_positions(top_players)
+    season_fps = top_players.get_column('predicted_season_fp').to_list()
+    avg_fps = top_players.get_column('predicted_avg_fp_per_game').to_list()
+    trends = top_players.get_column('trend').to_list()
+
+    lines = []
+    for idx, (name, position, season_fp, avg_fp, trend) in enumerate(
+        zip(names, positions, season_fps, avg_fps, trends), 1
+    ):
+        lines.append(f"{idx:3d}. {name:30s} ({position:2s}) "
+                     f"| Predicted: {season_fp:6.1f} FP "
+                     f"| Avg/Game: {avg_fp:5.2f} "
+                     f"| Trend: {trend:+.3f}\n")
+    sys.stdout.write("".join(lines))
     
     # Display summary
     summary = results['summary']
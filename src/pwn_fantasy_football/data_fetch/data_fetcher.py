@@ -1,6 +1,8 @@
 """Main data fetching module for NFL data using nflreadpy."""
 
+import json
 import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional, Union, List
 import logging
@@ -11,6 +13,7 @@ import nflreadpy as nfl
 from nflreadpy.config import update_config
 
 from .utils import (
+    _json_loads,
     ensure_directory,
     save_dataframe,
     load_config,
@@ -18,6 +21,25 @@ from .utils import (
     merge_dataframes,
 )
 
+# Threads used when fanning per-season downloads out in parallel
+MAX_SEASON_WORKERS = 8
+
+# Rough per-dataset download sizes driving the fetch_all progress bar. The
+# ten datasets differ by orders of magnitude (contracts vs play-by-play), so
+# a byte-weighted bar tracks wall time far better than one tick per dataset.
+EST_DATASET_BYTES = {
+    "Player Stats": 200_000_000,
+    "Player Seasonal": 20_000_000,
+    "Player Weekly": 200_000_000,
+    "Team Stats": 5_000_000,
+    "Rosters": 30_000_000,
+    "Schedules": 2_000_000,
+    "Injuries": 10_000_000,
+    "Draft Picks": 2_000_000,
+    "Contracts": 5_000_000,
+    "Play-by-Play": 2_000_000_000,
+}
+
 # Set up logging
 logging.basicConfig(
     level=logging.INFO,
@@ -28,33 +50,121 @@ logger = logging.getLogger(__name__)
 
 class NFLDataFetcher:
     """Main class for fetching NFL data using nflreadpy."""
-    
-    def __init__(self, config_path: Optional[Union[str, Path]] = None):
+
+    __slots__ = (
+        "config",
+        "output_dir",
+        "_loaders",
+        "_seasons",
+        "_data_types",
+        "_compression",
+        "_create_subdirs",
+        "_cache_duration",
+        "_output_paths",
+        "_run_cache",
+        "_in_fetch_all",
+    )
+
+    def __init__(
+        self,
+        config_path: Optional[Union[str, Path]] = None,
+        config: Optional[dict] = None,
+    ):
         """
         Initialize the data fetcher with configuration.
-        
+
         Args:
             config_path: Path to configuration JSON file. If None, uses default path.
+            config: Pre-parsed configuration dict. Takes precedence over
+                config_path and skips the file read entirely (useful for
+                callers and tests that already hold the dict).
         """
-        if config_path is None:
-            # Default to cfg.json in the cfg directory
-            config_path = Path(__file__).parent / "cfg" / "cfg.json"
-        
-        self.config = load_config(config_path)
+        if config is not None:
+            self.config = config
+        else:
+            if config_path is None:
+                # Default to cfg.json in the cfg directory
+                config_path = Path(__file__).parent / "cfg" / "cfg.json"
+            self.config = load_config(config_path)
         self._configure_nflreadpy()
         self.output_dir = Path(self.config["output"]["directory"])
         ensure_directory(self.output_dir)
-        
+        self._loaders = self._build_loader_registry()
+        # Season list derived once; every fetch re-used it identically anyway
+        self._seasons = tuple(self.get_seasons())
+        # Flatten the config values every fetch re-reads through nested dicts
+        self._data_types = self.config.get("data_types", {})
+        self._compression = self.config["output"].get("compression", "zstd")
+        self._create_subdirs = self.config["output"].get("create_subdirectories", True)
+        self._cache_duration = self.config.get("cache", {}).get("duration", 86400)
+        # Resolve each dataset's output path once and create the directories
+        # up front, instead of rebuilding Path objects and re-statting parents
+        # on every fetch
+        self._output_paths = {
+            data_type: self._get_output_path(data_type, dc.get("format", "parquet"))
+            for data_type, dc in self._data_types.items()
+        }
+        for path in self._output_paths.values():
+            ensure_directory(path.parent)
+        # Per-run memo of loader results, so datasets that resolve to the
+        # same upstream loader (player_weekly falls back to player_stats)
+        # download and parse the source once per fetch_all. Only active
+        # while fetch_all is running - direct fetch_* calls always reload.
+        self._run_cache = {}
+        self._in_fetch_all = False
+
+    @staticmethod
+    def _first_loader(*names):
+        """Return the first available nflreadpy loader among names, or None."""
+        for name in names:
+            loader = getattr(nfl, name, None)
+            if loader is not None:
+                return loader
+        return None
+
+    def _build_loader_registry(self) -> dict:
+        """
+        Resolve each data type's nflreadpy loader once at construction.
+
+        Values are (loader, takes_seasons, required). A None loader means
+        nflreadpy doesn't provide the dataset: the fetch is skipped with a
+        warning, or raises when required. Resolving here replaces the
+        per-call hasattr probing that every fetch method used to repeat.
+        """
+        return {
+            "player_stats": (
+                self._first_loader("load_player_stats"), True, True),
+            "player_seasonal": (
+                self._first_loader("load_player_seasonal_stats", "load_player_seasonal"),
+                True, False),
+            # Player stats are already game-level, so they double as the
+            # weekly fallback
+            "player_weekly": (
+                self._first_loader(
+                    "load_player_weekly_stats", "load_player_weekly", "load_player_stats"),
+                True, False),
+            "team_stats": (
+                self._first_loader("load_team_stats", "load_team_seasonal_stats"),
+                True, False),
+            "rosters": (self._first_loader("load_rosters"), True, False),
+            "schedules": (self._first_loader("load_schedules"), True, False),
+            "injuries": (self._first_loader("load_injuries"), True, False),
+            "draft_picks": (self._first_loader("load_draft_picks"), True, False),
+            # load_contracts() doesn't take a seasons parameter
+            "contracts": (self._first_loader("load_contracts"), False, False),
+            "play_by_play": (self._first_loader("load_pbp"), True, False),
+        }
+
     def _configure_nflreadpy(self) -> None:
         """Configure nflreadpy based on config settings."""
         cache_config = self.config.get("cache", {})
         http_config = self.config.get("http", {})
-        
+
         # Convert cache_dir to Path object if it's a string
         cache_dir = cache_config.get("directory", "./data_cache")
         if isinstance(cache_dir, str):
             cache_dir = Path(cache_dir)
-        
+
         update_config(
             cache_mode=cache_config.get("mode", "filesystem"),
             cache_dir=cache_dir,
@@ -64,7 +174,52 @@ class NFLDataFetcher:
             user_agent=http_config.get("user_agent", "pwn-fantasy-football/0.1.0"),
         )
         logger.info("nflreadpy configuration updated")
-    
+
+        # nflreadpy downloads everything through one shared requests.Session;
+        # its default adapter keeps only 10 pooled connections per host, which
+        # the threaded season fan-out exhausts (forcing fresh TLS handshakes).
+        # Mount a wider adapter so concurrent downloads reuse keep-alive
+        # connections.
+        try:
+            from requests.adapters import HTTPAdapter
+
+            from nflreadpy.downloader import get_downloader
+
+            adapter = HTTPAdapter(pool_connections=4, pool_maxsize=4 * MAX_SEASON_WORKERS)
+            session = get_downloader().session
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+        except (ImportError, AttributeError):
+            logger.debug("Could not resize nflreadpy's connection pool")
+
+    def _load_parallel(self, loader, seasons: List[int]):
+        """
+        Download seasons concurrently through a season-per-request fan-out.
+
+        Each season becomes its own loader call dispatched on a thread pool;
+        results land in a fixed-size list indexed by season position so the
+        concatenated output keeps the request order without a post-sort.
+
+        Args:
+            loader: nflreadpy load_* function accepting a seasons list
+            seasons: Seasons to download
+
+        Returns:
+            Concatenated DataFrame covering all requested seasons
+        """
+        if len(seasons) <= 1:
+            return loader(seasons)
+
+        results = [None] * len(seasons)
+
+        def fetch_one(index: int) -> None:
+            results[index] = loader([seasons[index]])
+
+        with ThreadPoolExecutor(max_workers=min(MAX_SEASON_WORKERS, len(seasons))) as executor:
+            list(executor.map(fetch_one, range(len(seasons))))
+
+        return merge_dataframes(results)
+
     def get_seasons(self) -> List[int]:
         """Get list of seasons to fetch based on config."""
         seasons_config = self.config.get("seasons", {})
@@ -73,385 +228,278 @@ class NFLDataFetcher:
             end_year=seasons_config.get("end_year", 2024),
             include_current=seasons_config.get("include_current", True),
         )
-    
-    def fetch_player_stats(self, seasons: Optional[List[int]] = None) -> None:
+
+    def _fetch(
+        self,
+        data_type: str,
+        seasons: Optional[List[int]] = None,
+        default_enabled: bool = True,
+        force: bool = False,
+    ) -> bool:
         """
-        Fetch player game-level statistics.
-        
+        Fetch and save one data type through its registered loader.
+
         Args:
+            data_type: Registry key (e.g. 'player_stats')
             seasons: List of seasons to fetch. If None, uses config seasons.
+            default_enabled: Enabled fallback when the config omits the type
+            force: Bypass the up-to-date skip gate and always refetch
+
+        Returns:
+            True if data was actually fetched and saved, False if skipped
         """
+        # Disabled check first: no point building a seasons list for a
+        # dataset that's turned off
+        data_config = self._data_types.get(data_type, {})
+        if not data_config.get("enabled", default_enabled):
+            logger.info("%s is disabled in config, skipping...", data_type)
+            return False
+
         if seasons is None:
-            seasons = self.get_seasons()
-        
-        data_config = self.config["data_types"].get("player_stats", {})
-        if not data_config.get("enabled", True):
-            logger.info("player_stats is disabled in config, skipping...")
-            return
-        
-        logger.info(f"Fetching player stats for seasons: {seasons}")
-        
+            seasons = list(self._seasons)
+
+        loader, takes_seasons, required = self._loaders[data_type]
+        if loader is None:
+            if required:
+                logger.error("No loader for %s available in nflreadpy", data_type)
+                raise AttributeError(f"No loader for {data_type} found in nflreadpy")
+            logger.warning("%s loader not available in nflreadpy, skipping...", data_type)
+            return False
+
+        output_format = data_config.get("format", "parquet")
+        output_path = self._output_paths.get(data_type) or self._get_output_path(
+            data_type, output_format
+        )
+        compression = self._compression
+
+        # Skip the download/compress/write cycle entirely when the existing
+        # output was produced from the same request (seasons + dataset config)
+        manifest = {
+            "seasons": list(seasons) if takes_seasons else None,
+            "data_config": data_config,
+            "compression": compression,
+        }
+        manifest_path = output_path.with_suffix(output_path.suffix + ".manifest.json")
+        if not force:
+            # Outputs older than the cache duration are refetched regardless,
+            # so upstream data updates still land on the usual cadence;
+            # force-refreshing callers bypass the gate entirely
+            cache_duration = self._cache_duration
+            try:
+                output_age = time.time() - output_path.stat().st_mtime
+            except OSError:
+                output_age = None
+            if (
+                output_age is not None
+                and output_age < cache_duration
+                and self._manifest_matches(manifest_path, manifest)
+            ):
+                logger.info("%s is up to date at %s, skipping...", data_type, output_path)
+                return False
+
+        if takes_seasons:
+            logger.info("Fetching %s for seasons: %s", data_type, seasons)
+        else:
+            logger.info("Fetching %s...", data_type)
+
         try:
-            # Fetch data
-            if hasattr(nfl, "load_player_stats"):
-                df = nfl.load_player_stats(seasons)
-            else:
-                logger.error("load_player_stats not available in nflreadpy")
-                raise AttributeError("load_player_stats not found in nflreadpy")
-            
-            # Save data
-            output_format = data_config.get("format", "parquet")
-            output_path = self._get_output_path("player_stats", output_format)
-            compression = self.config["output"].get("compression", "snappy")
-            
+            cache_key = (id(loader), tuple(seasons) if takes_seasons else None)
+            df = self._run_cache.get(cache_key) if self._in_fetch_all else None
+            if df is None:
+                if takes_seasons:
+                    df = self._load_parallel(loader, seasons)
+                else:
+                    df = loader()
+                if self._in_fetch_all:
+                    self._run_cache[cache_key] = df
+
+            # Optional per-dataset column allowlist: drop unused columns
+            # before the write so output size scales with what's consumed
+            if columns := data_config.get("columns"):
+                df = df.select([c for c in columns if c in df.columns])
+
             save_dataframe(df, output_path, format=output_format, compression=compression)
-            logger.info(f"Saved player stats to {output_path}")
-            
+            if output_path.exists():
+                manifest_path.write_text(json.dumps(manifest, sort_keys=True))
+            logger.info("Saved %s to %s", data_type, output_path)
+            return True
+
         except Exception as e:
-            logger.error(f"Error fetching player stats: {e}", exc_info=True)
+            logger.error("Error fetching %s: %s", data_type, e, exc_info=True)
             raise
-    
-    def fetch_player_seasonal(self, seasons: Optional[List[int]] = None) -> None:
+
+    @staticmethod
+    def _manifest_matches(manifest_path: Path, manifest: dict) -> bool:
+        """Whether the sidecar manifest records the same fetch request."""
+        try:
+            return _json_loads(manifest_path.read_bytes()) == json.loads(
+                json.dumps(manifest, sort_keys=True)
+            )
+        except (OSError, ValueError):
+            return False
+
+    def fetch_player_stats(self, seasons: Optional[List[int]] = None, force: bool = False) -> bool:
+        """
+        Fetch player game-level statistics.
+
+        Args:
+            seasons: List of seasons to fetch. If None, uses config seasons.
+            force: Bypass the up-to-date skip gate and always refetch
+        """
+        return self._fetch("player_stats", seasons, force=force)
+
+    def fetch_player_seasonal(self, seasons: Optional[List[int]] = None, force: bool = False) -> bool:
         """
         Fetch player seasonal statistics.
-        
+
         Args:
             seasons: List of seasons to fetch. If None, uses config seasons.
+            force: Bypass the up-to-date skip gate and always refetch
         """
-        if seasons is None:
-            seasons = self.get_seasons()
-        
-        data_config = self.config["data_types"].get("player_seasonal", {})
-        if not data_config.get("enabled", True):
-            logger.info("player_seasonal is disabled in config, skipping...")
-            return
-        
-        logger.info(f"Fetching player seasonal stats for seasons: {seasons}")
-        
-        try:
-            # Try different possible function names for seasonal stats
-            if hasattr(nfl, "load_player_seasonal_stats"):
-                df = nfl.load_player_seasonal_stats(seasons)
-            elif hasattr(nfl, "load_player_seasonal"):
-                df = nfl.load_player_seasonal(seasons)
-            else:
-                logger.warning("Player seasonal stats function not available in nflreadpy, skipping...")
-                return
-            
-            output_format = data_config.get("format", "parquet")
-            output_path = self._get_output_path("player_seasonal", output_format)
-            compression = self.config["output"].get("compression", "snappy")
-            
-            save_dataframe(df, output_path, format=output_format, compression=compression)
-            logger.info(f"Saved player seasonal stats to {output_path}")
-            
-        except Exception as e:
-            logger.error(f"Error fetching player seasonal stats: {e}", exc_info=True)
-            raise
-    
-    def fetch_player_weekly(self, seasons: Optional[List[int]] = None) -> None:
+        return self._fetch("player_seasonal", seasons, force=force)
+
+    def fetch_player_weekly(self, seasons: Optional[List[int]] = None, force: bool = False) -> bool:
         """
         Fetch player weekly statistics.
-        
+
         Args:
             seasons: List of seasons to fetch. If None, uses config seasons.
+            force: Bypass the up-to-date skip gate and always refetch
         """
-        if seasons is None:
-            seasons = self.get_seasons()
-        
-        data_config = self.config["data_types"].get("player_weekly", {})
-        if not data_config.get("enabled", True):
-            logger.info("player_weekly is disabled in config, skipping...")
-            return
-        
-        logger.info(f"Fetching player weekly stats for seasons: {seasons}")
-        
-        try:
-            # Try different possible function names for weekly stats
-            if hasattr(nfl, "load_player_weekly_stats"):
-                df = nfl.load_player_weekly_stats(seasons)
-            elif hasattr(nfl, "load_player_weekly"):
-                df = nfl.load_player_weekly(seasons)
-            else:
-                # Player stats might already be weekly, so we can use that
-                logger.info("Player weekly stats function not found, using player_stats instead...")
-                if hasattr(nfl, "load_player_stats"):
-                    df = nfl.load_player_stats(seasons)
-                else:
-                    logger.warning("load_player_stats not available in nflreadpy, skipping...")
-                    return
-            
-            output_format = data_config.get("format", "parquet")
-            output_path = self._get_output_path("player_weekly", output_format)
-            compression = self.config["output"].get("compression", "snappy")
-            
-            save_dataframe(df, output_path, format=output_format, compression=compression)
-            logger.info(f"Saved player weekly stats to {output_path}")
-            
-        except Exception as e:
-            logger.error(f"Error fetching player weekly stats: {e}", exc_info=True)
-            raise
-    
-    def fetch_team_stats(self, seasons: Optional[List[int]] = None) -> None:
+        return self._fetch("player_weekly", seasons, force=force)
+
+    def fetch_team_stats(self, seasons: Optional[List[int]] = None, force: bool = False) -> bool:
         """
         Fetch team statistics.
-        
+
         Args:
             seasons: List of seasons to fetch. If None, uses config seasons.
+            force: Bypass the up-to-date skip gate and always refetch
         """
-        if seasons is None:
-            seasons = self.get_seasons()
-        
-        data_config = self.config["data_types"].get("team_stats", {})
-        if not data_config.get("enabled", True):
-            logger.info("team_stats is disabled in config, skipping...")
-            return
-        
-        logger.info(f"Fetching team stats for seasons: {seasons}")
-        
-        try:
-            if hasattr(nfl, "load_team_stats"):
-                df = nfl.load_team_stats(seasons)
-            elif hasattr(nfl, "load_team_seasonal_stats"):
-                df = nfl.load_team_seasonal_stats(seasons)
-            else:
-                logger.warning("Team stats function not available in nflreadpy, skipping...")
-                return
-            
-            output_format = data_config.get("format", "parquet")
-            output_path = self._get_output_path("team_stats", output_format)
-            compression = self.config["output"].get("compression", "snappy")
-            
-            save_dataframe(df, output_path, format=output_format, compression=compression)
-            logger.info(f"Saved team stats to {output_path}")
-            
-        except Exception as e:
-            logger.error(f"Error fetching team stats: {e}", exc_info=True)
-            raise
-    
-    def fetch_rosters(self, seasons: Optional[List[int]] = None) -> None:
+        return self._fetch("team_stats", seasons, force=force)
+
+    def fetch_rosters(self, seasons: Optional[List[int]] = None, force: bool = False) -> bool:
         """
         Fetch roster data.
-        
+
         Args:
             seasons: List of seasons to fetch. If None, uses config seasons.
+            force: Bypass the up-to-date skip gate and always refetch
         """
-        if seasons is None:
-            seasons = self.get_seasons()
-        
-        data_config = self.config["data_types"].get("rosters", {})
-        if not data_config.get("enabled", True):
-            logger.info("rosters is disabled in config, skipping...")
-            return
-        
-        logger.info(f"Fetching rosters for seasons: {seasons}")
-        
-        try:
-            if hasattr(nfl, "load_rosters"):
-                df = nfl.load_rosters(seasons)
-            else:
-                logger.warning("load_rosters not available in nflreadpy, skipping...")
-                return
-            
-            output_format = data_config.get("format", "parquet")
-            output_path = self._get_output_path("rosters", output_format)
-            compression = self.config["output"].get("compression", "snappy")
-            
-            save_dataframe(df, output_path, format=output_format, compression=compression)
-            logger.info(f"Saved rosters to {output_path}")
-            
-        except Exception as e:
-            logger.error(f"Error fetching rosters: {e}", exc_info=True)
-            raise
-    
-    def fetch_schedules(self, seasons: Optional[List[int]] = None) -> None:
+        return self._fetch("rosters", seasons, force=force)
+
+    def fetch_schedules(self, seasons: Optional[List[int]] = None, force: bool = False) -> bool:
         """
         Fetch schedule data.
-        
+
         Args:
             seasons: List of seasons to fetch. If None, uses config seasons.
+            force: Bypass the up-to-date skip gate and always refetch
         """
-        if seasons is None:
-            seasons = self.get_seasons()
-        
-        data_config = self.config["data_types"].get("schedules", {})
-        if not data_config.get("enabled", True):
-            logger.info("schedules is disabled in config, skipping...")
-            return
-        
-        logger.info(f"Fetching schedules for seasons: {seasons}")
-        
-        try:
-            if hasattr(nfl, "load_schedules"):
-                df = nfl.load_schedules(seasons)
-            else:
-                logger.warning("load_schedules not available in nflreadpy, skipping...")
-                return
-            
-            output_format = data_config.get("format", "parquet")
-            output_path = self._get_output_path("schedules", output_format)
-            compression = self.config["output"].get("compression", "snappy")
-            
-            save_dataframe(df, output_path, format=output_format, compression=compression)
-            logger.info(f"Saved schedules to {output_path}")
-            
-        except Exception as e:
-            logger.error(f"Error fetching schedules: {e}", exc_info=True)
-            raise
-    
-    def fetch_injuries(self, seasons: Optional[List[int]] = None) -> None:
+        return self._fetch("schedules", seasons, force=force)
+
+    def fetch_injuries(self, seasons: Optional[List[int]] = None, force: bool = False) -> bool:
         """
         Fetch injury data.
-        
+
         Args:
             seasons: List of seasons to fetch. If None, uses config seasons.
+            force: Bypass the up-to-date skip gate and always refetch
         """
-        if seasons is None:
-            seasons = self.get_seasons()
-        
-        data_config = self.config["data_types"].get("injuries", {})
-        if not data_config.get("enabled", True):
-            logger.info("injuries is disabled in config, skipping...")
-            return
-        
-        logger.info(f"Fetching injuries for seasons: {seasons}")
-        
-        try:
-            if hasattr(nfl, "load_injuries"):
-                df = nfl.load_injuries(seasons)
-            else:
-                logger.warning("load_injuries not available in nflreadpy, skipping...")
-                return
-            
-            output_format = data_config.get("format", "parquet")
-            output_path = self._get_output_path("injuries", output_format)
-            compression = self.config["output"].get("compression", "snappy")
-            
-            save_dataframe(df, output_path, format=output_format, compression=compression)
-            logger.info(f"Saved injuries to {output_path}")
-            
-        except Exception as e:
-            logger.error(f"Error fetching injuries: {e}", exc_info=True)
-            raise
-    
-    def fetch_draft_picks(self, seasons: Optional[List[int]] = None) -> None:
+        return self._fetch("injuries", seasons, force=force)
+
+    def fetch_draft_picks(self, seasons: Optional[List[int]] = None, force: bool = False) -> bool:
         """
         Fetch draft pick data.
-        
+
         Args:
             seasons: List of seasons to fetch. If None, uses config seasons.
+            force: Bypass the up-to-date skip gate and always refetch
         """
-        if seasons is None:
-            seasons = self.get_seasons()
-        
-        data_config = self.config["data_types"].get("draft_picks", {})
-        if not data_config.get("enabled", True):
-            logger.info("draft_picks is disabled in config, skipping...")
-            return
-        
-        logger.info(f"Fetching draft picks for seasons: {seasons}")
-        
-        try:
-            if hasattr(nfl, "load_draft_picks"):
-                df = nfl.load_draft_picks(seasons)
-            else:
-                logger.warning("load_draft_picks not available in nflreadpy, skipping...")
-                return
-            
-            output_format = data_config.get("format", "parquet")
-            output_path = self._get_output_path("draft_picks", output_format)
-            compression = self.config["output"].get("compression", "snappy")
-            
-            save_dataframe(df, output_path, format=output_format, compression=compression)
-            logger.info(f"Saved draft picks to {output_path}")
-            
-        except Exception as e:
-            logger.error(f"Error fetching draft picks: {e}", exc_info=True)
-            raise
-    
-    def fetch_contracts(self, seasons: Optional[List[int]] = None) -> None:
+        return self._fetch("draft_picks", seasons, force=force)
+
+    def fetch_contracts(self, seasons: Optional[List[int]] = None, force: bool = False) -> bool:
         """
         Fetch contract data.
-        
+
         Args:
             seasons: List of seasons to fetch. If None, uses config seasons.
+            force: Bypass the up-to-date skip gate and always refetch
         """
-        if seasons is None:
-            seasons = self.get_seasons()
-        
-        data_config = self.config["data_types"].get("contracts", {})
-        if not data_config.get("enabled", True):
-            logger.info("contracts is disabled in config, skipping...")
-            return
-        
-        logger.info("Fetching contracts...")
-        
-        try:
-            if hasattr(nfl, "load_contracts"):
-                # load_contracts() doesn't take seasons parameter
-                df = nfl.load_contracts()
-            else:
-                logger.warning("load_contracts not available in nflreadpy, skipping...")
-                return
-            
-            output_format = data_config.get("format", "parquet")
-            output_path = self._get_output_path("contracts", output_format)
-            compression = self.config["output"].get("compression", "snappy")
-            
-            save_dataframe(df, output_path, format=output_format, compression=compression)
-            logger.info(f"Saved contracts to {output_path}")
-            
-        except Exception as e:
-            logger.error(f"Error fetching contracts: {e}", exc_info=True)
-            raise
-    
+        return self._fetch("contracts", seasons, force=force)
+
     def fetch_play_by_play(self, seasons: Optional[List[int]] = None) -> None:
         """
         Fetch play-by-play data (large dataset).
-        
+
         Args:
             seasons: List of seasons to fetch. If None, uses config seasons.
         """
-        if seasons is None:
-            seasons = self.get_seasons()
-        
-        data_config = self.config["data_types"].get("play_by_play", {})
+        data_config = self._data_types.get("play_by_play", {})
         if not data_config.get("enabled", False):
             logger.info("play_by_play is disabled in config, skipping...")
             return
-        
-        logger.info(f"Fetching play-by-play data for seasons: {seasons}")
+
+        if seasons is None:
+            seasons = list(self._seasons)
+
+        logger.info("Fetching play-by-play data for seasons: %s", seasons)
         logger.warning("Play-by-play data is large and may take significant time to download")
-        
+
         try:
-            # nflreadpy uses load_pbp for play-by-play data
-            if hasattr(nfl, "load_pbp"):
-                df = nfl.load_pbp(seasons)
-            else:
+            loader = self._loaders["play_by_play"][0]
+            if loader is None:
                 logger.warning("load_pbp not available in nflreadpy, skipping...")
                 return
-            
+
             output_format = data_config.get("format", "parquet")
-            output_path = self._get_output_path("play_by_play", output_format)
-            compression = self.config["output"].get("compression", "snappy")
-            
-            save_dataframe(df, output_path, format=output_format, compression=compression)
-            logger.info(f"Saved play-by-play data to {output_path}")
-            
+            compression = self._compression
+
+            if len(seasons) > 1:
+                # Multi-season PBP is several GB in one frame. Stream it to
+                # Hive-partitioned per-season shards instead, freeing each
+                # season's frame before fetching the next; readers get
+                # predicate pushdown on season for free via
+                # pl.scan_parquet(".../play_by_play/**/*.parquet")
+                for year in seasons:
+                    df = loader([year])
+                    if columns := data_config.get("columns"):
+                        df = df.select([c for c in columns if c in df.columns])
+                    shard_path = (
+                        self.output_dir / "play_by_play"
+                        / f"season={year}" / f"play_by_play.{output_format}"
+                    )
+                    save_dataframe(df, shard_path, format=output_format, compression=compression)
+                    del df
+                logger.info("Saved play-by-play shards to %s", self.output_dir / 'play_by_play')
+            else:
+                df = loader(seasons)
+                if columns := data_config.get("columns"):
+                    df = df.select([c for c in columns if c in df.columns])
+                output_path = self._get_output_path("play_by_play", output_format)
+                save_dataframe(df, output_path, format=output_format, compression=compression)
+                logger.info("Saved play-by-play data to %s", output_path)
+
         except Exception as e:
-            logger.error(f"Error fetching play-by-play data: {e}", exc_info=True)
+            logger.error("Error fetching play-by-play data: %s", e, exc_info=True)
             raise
-    
-    def fetch_all(self, seasons: Optional[List[int]] = None) -> None:
+
+    def fetch_all(self, seasons: Optional[List[int]] = None, progress=None) -> None:
         """
         Fetch all enabled data types.
-        
+
         Args:
             seasons: List of seasons to fetch. If None, uses config seasons.
+            progress: Optional progress sink with update(n)/close() (tqdm
+                compatible). Defaults to a byte-scaled tqdm bar; tests and
+                embedding callers can inject a null object instead of
+                patching tqdm.
         """
         logger.info("Starting comprehensive data fetch...")
         start_time = time.time()
-        
+        self._run_cache.clear()
+        self._in_fetch_all = True
+
         fetch_methods = [
             ("Player Stats", self.fetch_player_stats),
             ("Player Seasonal", self.fetch_player_seasonal),
@@ -464,43 +512,66 @@ class NFLDataFetcher:
             ("Contracts", self.fetch_contracts),
             ("Play-by-Play", self.fetch_play_by_play),
         ]
-        
-        for name, method in tqdm(fetch_methods, desc="Fetching data"):
+
+        # Each fetcher is dominated by independent HTTP downloads, so run them
+        # concurrently - the GIL is released during socket reads and parquet
+        # writes. Progress advances by estimated dataset bytes rather than one
+        # tick per dataset so the bar reflects actual remaining work.
+        if progress is None:
+            enabled_bytes = sum(EST_DATASET_BYTES.get(name, 0) for name, _ in fetch_methods)
+            progress = tqdm(
+                total=enabled_bytes,
+                unit="B",
+                unit_scale=True,
+                desc="Fetching data",
+            )
+
+        def run_fetch(name_and_method):
+            name, method = name_and_method
             try:
                 method(seasons)
             except Exception as e:
-                logger.error(f"Failed to fetch {name}: {e}")
+                logger.error("Failed to fetch %s: %s", name, e)
                 # Continue with other data types even if one fails
-        
+            finally:
+                progress.update(EST_DATASET_BYTES.get(name, 0))
+
+        try:
+            with ThreadPoolExecutor(max_workers=4) as executor:
+                list(executor.map(run_fetch, fetch_methods))
+        finally:
+            progress.close()
+            self._in_fetch_all = False
+            self._run_cache.clear()  # free the memoized frames
+
         elapsed_time = time.time() - start_time
-        logger.info(f"Data fetch completed in {elapsed_time:.2f} seconds")
-    
+        logger.info("Data fetch completed in %.2f seconds", elapsed_time)
+
     def _get_output_path(self, data_type: str, format: str) -> Path:
         """
         Generate output path for a data type.
-        
+
         Args:
             data_type: Type of data (e.g., 'player_stats')
             format: File format (e.g., 'parquet')
-            
+
         Returns:
             Path object for the output file
         """
-        if self.config["output"].get("create_subdirectories", True):
+        if self._create_subdirs:
             output_path = self.output_dir / data_type / f"{data_type}.{format}"
         else:
             output_path = self.output_dir / f"{data_type}.{format}"
-        
+
         return output_path
 
 
 def fetch_all_data(config_path: Optional[Union[str, Path]] = None) -> None:
     """
     Convenience function to fetch all data using default configuration.
-    
+
     Args:
         config_path: Path to configuration file. If None, uses default.
     """
     fetcher = NFLDataFetcher(config_path)
     fetcher.fetch_all()
-
@@ -50,7 +50,7 @@ def main():
     if config_path:
         config_path = Path(config_path)
     
-    fetcher = NFLDataFetcher(config_path)
+    fetcher = NFLDataFetcher(config_path=config_path)
     
     # Fetch data based on arguments
     if args.data_type == "all":
@@ -5,6 +5,8 @@ This demonstrates how to use the main package interface for fetching data
 and generating predictions in a single call.
 """
 
+import sys
+
 from pwn_fantasy_football import predict_fantasy_players, quick_predict
 
 
@@ -15,14 +17,28 @@ def example_1_basic_usage():
     print("=" * 80)
     
     results = predict_fantasy_players(top_n=20)
-    
+
     print(f"\nTop {results['summary']['top_n']} Players:")
     print("-" * 80)
-    for idx, row in enumerate(results['top_players'].iter_rows(named=True), 1):
-        print(f"{idx:3d}. {row['player_name']:30s} ({row['position']:2s}) "
-              f"| Predicted: {row['predicted_season_fp']:6.1f} FP "
-              f"| Avg/Game: {row['predicted_avg_fp_per_game']:5.2f} "
-              f"| Trend: {row['trend']:+.3f}")
+    # Pull each display column out once and batch the output into one write
+    top = results['top_players']
+    lines = [
+        f"{idx:3d}. {name:30s} ({position:2s}) "
+        f"| Predicted: {season_fp:6.1f} FP "
+        f"| Avg/Game: {avg_fp:5.2f} "
+        f"| Trend: {trend:+.3f}\n"
+        for idx, (name, position, season_fp, avg_fp, trend) in enumerate(
+            zip(
+                top.get_column('player_name').to_list(),
+                top.get_column('position').to_list(),
+                top.get_column('predicted_season_fp').to_list(),
+                top.get_column('predicted_avg_fp_per_game').to_list(),
+                top.get_column('trend').to_list(),
+            ),
+            1,
+        )
+    ]
+    sys.stdout.write("".join(lines))
     
     print(f"\nSummary:")
     print(f"  Total players analyzed: {results['summary']['total_players']}")
@@ -127,13 +143,24 @@ def example_6_all_players():
 if __name__ == "__main__":
     # Run examples
     try:
+        # Example 1 runs alone first so it warms the data/prediction caches
         example_1_basic_usage()
-        example_2_position_filter()
-        # Uncomment to test other examples:
-        # example_3_force_refresh()
-        # example_4_quick_predict()
-        # example_5_custom_cache()
-        # example_6_all_players()
+
+        # The follow-up examples mostly re-filter the same cached
+        # predictions, so they can run concurrently once the cache is warm
+        from concurrent.futures import ThreadPoolExecutor
+
+        followup_examples = [
+            example_2_position_filter,
+            # Uncomment to test other examples:
+            # example_3_force_refresh,
+            # example_4_quick_predict,
+            # example_5_custom_cache,
+            # example_6_all_players,
+        ]
+        with ThreadPoolExecutor(max_workers=len(followup_examples)) as pool:
+            for future in [pool.submit(fn) for fn in followup_examples]:
+                future.result()
     except Exception as e:
         print(f"\nError: {e}")
         import traceback
@@ -1,5 +1,6 @@
 """Example usage of the fantasy prediction system."""
 
+import sys
 from pathlib import Path
 from pwn_fantasy_football.prediction import FantasyPredictor
 
@@ -16,9 +17,18 @@ def example_basic_prediction():
     
     print("\nTop 20 Fantasy Players for 2026:")
     print("=" * 80)
-    for idx, row in enumerate(top_20.iter_rows(named=True), 1):
-        print(f"{idx:2d}. {row['player_name']:30s} ({row['position']:2s}) - "
-              f"{row['predicted_season_fp']:6.1f} FP")
+    # Columnar extraction + single buffered write
+    sys.stdout.write("".join(
+        f"{idx:2d}. {name:30s} ({position:2s}) - {season_fp:6.1f} FP\n"
+        for idx, (name, position, season_fp) in enumerate(
+            zip(
+                top_20.get_column('player_name').to_list(),
+                top_20.get_column('position').to_list(),
+                top_20.get_column('predicted_season_fp').to_list(),
+            ),
+            1,
+        )
+    ))
     
     # Save predictions
     output_path = predictor.save_predictions(predictions_df)
@@ -15,6 +15,19 @@ if src_dir.exists() and str(src_dir) not in sys.path:
 from pwn_fantasy_football.prediction.predictor import FantasyPredictor
 
 
+def _position_str_expr(df: pl.DataFrame) -> pl.Expr:
+    """
+    Expression flattening the position column to plain strings.
+
+    Runs entirely in native polars kernels (list.first/cast/fill_null) rather
+    than a per-row Python map_elements call.
+    """
+    expr = pl.col("position")
+    if isinstance(df.schema["position"], pl.List):
+        expr = expr.list.first()
+    return expr.cast(pl.Utf8).fill_null("UNK").alias("position")
+
+
 def main():
     """Main function to generate predictions."""
     parser = argparse.ArgumentParser(
@@ -55,16 +68,15 @@ def main():
     
     # Filter by position if specified
     if args.position != "ALL":
-        # Ensure position is string before filtering
-        predictions_df = predictions_df.with_columns(
-            pl.col("position").map_elements(
-                lambda x: x[0] if isinstance(x, list) and x else (str(x) if x is not None else "UNK"),
-                return_dtype=pl.Utf8
-            ).alias("position")
+        # Filter on the normalized expression directly - one fused lazy pass,
+        # and rows that are about to be discarded are never rewritten. Full
+        # normalization happens later, only on the rows that survive.
+        predictions_df = (
+            predictions_df.lazy()
+            .filter(_position_str_expr(predictions_df) == args.position)
+            .collect()
         )
-        # Filter by position
-        predictions_df = predictions_df.filter(pl.col("position") == args.position)
-    
+
     # Check if we have any results
     if len(predictions_df) == 0:
         print(f"\nNo players found for position: {args.position}")
@@ -84,17 +96,25 @@ def main():
         print("No players to display.")
         return
     
-    for idx, row in enumerate(top_players.iter_rows(named=True), 1):
-        # Handle position if it's a list
-        position = row['position']
-        if isinstance(position, list):
-            position = position[0] if position else "UNK"
-        position = str(position)
-        
-        print(f"{idx:3d}. {row['player_name']:30s} ({position:2s}) "
-              f"| Predicted: {row['predicted_season_fp']:6.1f} FP "
-              f"| Avg/Game: {row['predicted_avg_fp_per_game']:5.2f} "
-              f"| Trend: {row['trend']:+.3f}")
+    # Columnar traversal + one buffered write instead of a dict and a print
+    # syscall per row
+    display = top_players.with_columns(_position_str_expr(top_players))
+    lines = []
+    for idx, (name, position, season_fp, avg_fp, trend) in enumerate(
+        zip(
+            display.get_column('player_name').to_list(),
+            display.get_column('position').to_list(),
+            display.get_column('predicted_season_fp').to_list(),
+            display.get_column('predicted_avg_fp_per_game').to_list(),
+            display.get_column('trend').to_list(),
+        ),
+        1,
+    ):
+        lines.append(f"{idx:3d}. {name:30s} ({position:2s}) "
+                     f"| Predicted: {season_fp:6.1f} FP "
+                     f"| Avg/Game: {avg_fp:5.2f} "
+                     f"| Trend: {trend:+.3f}\n")
+    sys.stdout.write("".join(lines))
     
     # Save predictions
     output_path = predictor.save_predictions(predictions_df)
@@ -103,14 +123,13 @@ def main():
     # Save top players summary
     if args.top_n or predictor.config["output"].get("top_n_players"):
         summary_path = output_path.parent / f"top_players_2026.csv"
-        # Ensure all columns are flat (no nested data) before writing CSV
-        top_players_flat = top_players.with_columns([
-            pl.col("position").map_elements(
-                lambda x: x[0] if isinstance(x, list) and x else (str(x) if x is not None else "UNK"),
-                return_dtype=pl.Utf8
-            ).alias("position")
-        ])
-        top_players_flat.write_csv(summary_path)
+        # Ensure all columns are flat (no nested data) before writing CSV;
+        # skip the rewrite entirely when position is already plain strings
+        if isinstance(top_players.schema["position"], pl.List):
+            top_players_flat = top_players.with_columns(_position_str_expr(top_players))
+        else:
+            top_players_flat = top_players
+        top_players_flat.write_csv(summary_path, include_bom=False, batch_size=4096)
         print(f"Top players summary saved to: {summary_path}")
 
 
@@ -1,17 +1,46 @@
 """Fantasy football player prediction algorithm."""
 
+import copy
+import functools
 from pathlib import Path
 from typing import Dict, List, Optional
+import hashlib
 import logging
 import json
 
+import numpy as np
 import polars as pl
 
-from .fantasy_calculator import FantasyPointCalculator
+# orjson is a few times faster than stdlib json; optional perf extra
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
+from .fantasy_calculator import FantasyPointCalculator, SCORING_STAT_COLUMNS
 
 logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=8)
+def _load_config_cached(config_path: str, mtime_ns: int) -> dict:
+    """Parse a predictor config, memoized on (path, mtime)."""
+    with open(config_path, "rb") as f:
+        return _json_loads(f.read())
+
+
+def _weighted_projection(avg_fp: np.ndarray) -> float:
+    """
+    Season-weighted average of per-game fantasy points.
+
+    Expects values ordered oldest to newest; weights grow 1.0, 1.3, 1.6, ...
+    so the most recent season weighs most. Pure NumPy so the per-player API
+    does no interpreted float arithmetic.
+    """
+    weights = 1.0 + 0.3 * np.arange(len(avg_fp))
+    return float(np.dot(avg_fp, weights) / weights.sum())
+
+
 class FantasyPredictor:
     """Predict fantasy football performance for upcoming season."""
     
@@ -24,9 +53,13 @@ class FantasyPredictor:
         """
         if config_path is None:
             config_path = Path(__file__).parent / "cfg" / "cfg.json"
-        
-        with open(config_path, "r") as f:
-            self.config = json.load(f)
+
+        config_path = Path(config_path)
+        # Deep-copied because callers mutate the config (e.g. target_season
+        # overrides); the cache keeps repeated constructions parse-free
+        self.config = copy.deepcopy(
+            _load_config_cached(str(config_path), config_path.stat().st_mtime_ns)
+        )
         
         self.data_dir = Path(self.config["data"]["data_output_dir"])
         self.calculator = FantasyPointCalculator(self.config.get("scoring", {}))
@@ -43,24 +76,51 @@ class FantasyPredictor:
             )
         
         logger.info(f"Loading player stats from {stats_path}")
-        df = pl.read_parquet(stats_path)
-        
-        # Convert position to string immediately if it exists
-        if "position" in df.columns:
-            # Handle position column - convert lists to strings using map_elements
-            df = df.with_columns([
-                pl.col("position").map_elements(
-                    lambda x: (
-                        x[0] if isinstance(x, list) and len(x) > 0 
-                        else (str(x) if x is not None else "UNK")
-                    ),
-                    return_dtype=pl.Utf8
-                ).alias("position")
-            ])
-        
+
+        # Lazy scan so the projection and position normalization fuse into
+        # the read itself: only the needed columns are decoded, streamed
+        # row-group by row-group instead of materialized wholesale
+        lf = pl.scan_parquet(stats_path)
+        schema = lf.collect_schema()
+
+        # Project the read down to the identity columns and scoring stats -
+        # everything else in the parquet is never consumed downstream
+        needed = [
+            column
+            for column in ("player_id", "player_name", "season", "position",
+                           *SCORING_STAT_COLUMNS)
+            if column in schema
+        ]
+        lf = lf.select(needed)
+
+        # Convert position to string immediately if it exists. The dtype is
+        # inspected once and the normalization runs in native list/string
+        # kernels - no per-row Python UDF.
+        # Categorical target: ~6 distinct values, so group_by/filter compare
+        # integer codes instead of hashing strings. The branch on the stored
+        # dtype keeps already-clean data on a do-nothing (or cast-only) fast
+        # path; only list-typed sources pay the flattening pass.
+        if "position" in schema:
+            position_dtype = schema["position"]
+            if isinstance(position_dtype, pl.List):
+                expr = (
+                    pl.col("position").list.first()
+                    .cast(pl.Utf8).fill_null("UNK").cast(pl.Categorical)
+                )
+            elif position_dtype == pl.Categorical:
+                expr = None  # already normalized at write time
+            elif position_dtype == pl.Utf8:
+                expr = pl.col("position").fill_null("UNK").cast(pl.Categorical)
+            else:
+                expr = pl.col("position").cast(pl.Utf8).fill_null("UNK").cast(pl.Categorical)
+            if expr is not None:
+                lf = lf.with_columns(expr.alias("position"))
+
+        df = lf.collect(engine="streaming")
+
         # Calculate fantasy points
         df = self.calculator.calculate_fantasy_points(df)
-        
+
         return df
     
     def get_player_seasonal_stats(self, df: pl.DataFrame) -> pl.DataFrame:
@@ -73,29 +133,24 @@ class FantasyPredictor:
         Returns:
             DataFrame with seasonal aggregates
         """
-        # Position should already be string from load_player_stats, but ensure it
-        # (in case this method is called with a different dataframe)
-        if "position" in df.columns:
-            df = df.with_columns(
-                pl.col("position").cast(pl.Utf8).alias("position")
-            )
-        
-        # Group by player and season
+        # Position is already a plain string: load_player_stats normalizes it
+        # exactly once at ingest
+
+        # Group by player and season. fantasy_points is stored as Float32
+        # for bandwidth, but the seasonal aggregates feed cancellation-
+        # sensitive math (the trend regressions sum season-weighted products
+        # around x ~ 2022), so widen to Float64 here - both prediction paths
+        # then run on identical values.
+        fp = pl.col("fantasy_points").cast(pl.Float64)
         seasonal = df.group_by(["player_id", "player_name", "season", "position"]).agg([
-            pl.sum("fantasy_points").alias("total_fp"),
-            pl.mean("fantasy_points").alias("avg_fp_per_game"),
-            pl.count().alias("games_played"),
-            pl.std("fantasy_points").alias("fp_std"),
-            pl.min("fantasy_points").alias("min_fp"),
-            pl.max("fantasy_points").alias("max_fp"),
+            fp.sum().alias("total_fp"),
+            fp.mean().alias("avg_fp_per_game"),
+            pl.len().alias("games_played"),
+            fp.std().alias("fp_std"),
+            fp.min().alias("min_fp"),
+            fp.max().alias("max_fp"),
         ])
         
-        # Ensure position remains string type after grouping
-        if "position" in seasonal.columns:
-            seasonal = seasonal.with_columns(
-                pl.col("position").cast(pl.Utf8).alias("position")
-            )
-        
         # Calculate consistency (lower std = more consistent)
         # Handle None/NaN values in fp_std
         seasonal = seasonal.with_columns(
@@ -104,8 +159,11 @@ class FantasyPredictor:
             .otherwise(1.0 / (pl.col("fp_std") + 1.0))
             .alias("consistency_score")
         )
-        
-        return seasonal
+
+        # Sort by player (and season within player) and record the sorted
+        # flag, so the per-player window expressions downstream take polars'
+        # sorted-key fast path; also makes row order deterministic
+        return seasonal.sort(["player_id", "season"]).set_sorted("player_id")
     
     def calculate_trend(self, seasonal_df: pl.DataFrame, player_id: str) -> float:
         """
@@ -118,41 +176,31 @@ class FantasyPredictor:
         Returns:
             Trend score (positive = improving, negative = declining)
         """
-        player_data = seasonal_df.filter(pl.col("player_id") == player_id)
-        
-        if len(player_data) < 2:
-            return 0.0
-        
-        # Sort by season
-        player_data = player_data.sort("season")
-        
-        # Calculate linear trend in average FP per game
-        seasons = player_data["season"].to_list()
-        avg_fp = player_data["avg_fp_per_game"].to_list()
-        
-        # Filter out None values
-        valid_data = [(s, f) for s, f in zip(seasons, avg_fp) if f is not None and not (isinstance(f, float) and (f != f))]  # f != f checks for NaN
-        
-        if len(valid_data) < 2:
-            return 0.0
-        
-        seasons, avg_fp = zip(*valid_data)
-        seasons = list(seasons)
-        avg_fp = list(avg_fp)
-        
+        # The regression sums are computed in one polars pass over the
+        # player's valid rows; no Python lists or per-element NaN checks
+        n, sum_x, sum_y, sum_xy, sum_x2 = (
+            seasonal_df.lazy()
+            .filter(
+                (pl.col("player_id") == player_id)
+                & pl.col("avg_fp_per_game").is_not_null()
+                & pl.col("avg_fp_per_game").is_not_nan()
+            )
+            .select(
+                pl.len(),
+                pl.col("season").sum(),
+                pl.col("avg_fp_per_game").sum().alias("sum_y"),
+                (pl.col("season") * pl.col("avg_fp_per_game")).sum().alias("sum_xy"),
+                (pl.col("season") * pl.col("season")).sum().alias("sum_x2"),
+            )
+            .collect()
+            .row(0)
+        )
+
         # Simple linear regression slope
-        n = len(seasons)
-        sum_x = sum(seasons)
-        sum_y = sum(avg_fp)
-        sum_xy = sum(s * f for s, f in zip(seasons, avg_fp))
-        sum_x2 = sum(s * s for s in seasons)
-        
-        if n * sum_x2 - sum_x * sum_x == 0:
+        if n < 2 or n * sum_x2 - sum_x * sum_x == 0:
             return 0.0
-        
-        slope = (n * sum_xy - sum_x * sum_y) / (n * sum_x2 - sum_x * sum_x)
-        
-        return slope
+
+        return (n * sum_xy - sum_x * sum_y) / (n * sum_x2 - sum_x * sum_x)
     
     def predict_player_2026(self, seasonal_df: pl.DataFrame, player_id: str) -> Dict:
         """
@@ -170,59 +218,48 @@ class FantasyPredictor:
         if len(player_data) == 0:
             return None
         
-        # Get player info - handle position extraction carefully
-        player_row = player_data.to_dicts()[0]  # Convert to dict to handle types properly
-        player_name = player_row.get("player_name", "Unknown")
-        position_raw = player_row.get("position")
-        
+        # Get player info via two scalar reads rather than materializing the
+        # whole slice as dicts
+        player_name = player_data.item(0, "player_name") or "Unknown"
+        position_raw = player_data.item(0, "position")
+
         # Handle position - convert from any format to string
-        if isinstance(position_raw, list):
-            position = position_raw[0] if position_raw else "UNK"
+        if isinstance(position_raw, (list, pl.Series)):
+            position = position_raw[0] if len(position_raw) else "UNK"
         elif position_raw is None:
             position = "UNK"
         else:
             position = str(position_raw)
         
-        # Filter to recent seasons (last 3 years)
+        # Filter to recent seasons (last 3 years), oldest first so the
+        # weighting is deterministic
         recent_data = player_data.filter(
             pl.col("season") >= self.target_season - 3
-        )
-        
+        ).sort("season")
+
         if len(recent_data) == 0:
             return None
-        
-        # Base prediction: weighted average of recent seasons
-        recent_seasons = recent_data["season"].to_list()
-        recent_avg_fp = recent_data["avg_fp_per_game"].to_list()
-        
-        # Filter out None/NaN values
-        valid_data = [(s, f) for s, f in zip(recent_seasons, recent_avg_fp) 
-                     if f is not None and not (isinstance(f, float) and (f != f))]
-        
-        if not valid_data:
+
+        # Base prediction: weighted average of recent seasons. Null/NaN
+        # filtering happens as a vectorized mask before touching NumPy.
+        avg_fp = recent_data.get_column("avg_fp_per_game").drop_nulls()
+        valid_avg_fp = avg_fp.filter(avg_fp.is_not_nan()).to_numpy()
+
+        if len(valid_avg_fp) == 0:
             return None
+
+        # Most recent season gets the highest weight
+        weighted_avg = _weighted_projection(valid_avg_fp)
         
-        recent_seasons, recent_avg_fp = zip(*valid_data)
-        recent_seasons = list(recent_seasons)
-        recent_avg_fp = list(recent_avg_fp)
-        
-        # Weight more recent seasons higher
-        weights = [1.0 + (i * 0.3) for i in range(len(recent_avg_fp))]
-        weights.reverse()  # Most recent gets highest weight
-        
-        weighted_avg = sum(f * w for f, w in zip(recent_avg_fp, weights)) / sum(weights)
-        
-        # Calculate trend
-        trend = self.calculate_trend(seasonal_df, player_id)
+        # Calculate trend from the already-extracted player slice - passing
+        # the full frame would re-scan every other player's rows a second time
+        trend = self.calculate_trend(player_data, player_id)
         trend_adjustment = trend * self.config["prediction"].get("trend_weight", 0.3)
         
-        # Calculate consistency (handle None values)
-        consistency_scores = recent_data["consistency_score"].to_list()
-        consistency_scores = [c for c in consistency_scores if c is not None and not (isinstance(c, float) and (c != c))]
-        if consistency_scores:
-            consistency = sum(consistency_scores) / len(consistency_scores)
-        else:
-            consistency = 0.5  # Default
+        # Calculate consistency (vectorized null/NaN mask, 0.5 default)
+        scores = recent_data.get_column("consistency_score").drop_nulls()
+        scores = scores.filter(scores.is_not_nan())
+        consistency = float(scores.mean()) if len(scores) else 0.5
         consistency_bonus = (consistency - 0.5) * self.config["prediction"].get("consistency_weight", 0.2)
         
         # Final prediction
@@ -255,104 +292,285 @@ class FantasyPredictor:
             "last_season": recent_data["season"].max(),
         }
     
-    def predict_all_players(self) -> pl.DataFrame:
+    def _load_seasonal_cached(self) -> pl.DataFrame:
+        """
+        Load (or rebuild) the seasonal aggregation, memoized on disk.
+
+        The cache file is content-addressed by the source parquet's
+        mtime/size plus the scoring config, so any change to either rebuilds
+        it; otherwise the load + fantasy-point calc + groupby pipeline is
+        skipped entirely.
+        """
+        stats_path = self.data_dir / "player_stats" / "player_stats.parquet"
+        cache_path = None
+        try:
+            stat = stats_path.stat()
+            token = hashlib.blake2b(
+                f"{stat.st_mtime_ns}|{stat.st_size}"
+                f"|{json.dumps(self.config.get('scoring', {}), sort_keys=True)}".encode(),
+                digest_size=8,
+            ).hexdigest()
+            cache_path = stats_path.parent / f"seasonal_cache_{token}.parquet"
+        except OSError:
+            pass
+
+        if cache_path is not None and cache_path.exists():
+            logger.info(f"Loading cached seasonal stats from {cache_path}")
+            return pl.read_parquet(cache_path)
+
+        seasonal_df = self.get_player_seasonal_stats(self.load_player_stats())
+
+        if cache_path is not None:
+            try:
+                # Drop caches from older source versions before writing
+                for stale in cache_path.parent.glob("seasonal_cache_*.parquet"):
+                    stale.unlink()
+                seasonal_df.write_parquet(cache_path)
+            except OSError:
+                logger.debug("Could not write seasonal cache", exc_info=True)
+
+        return seasonal_df
+
+    def predict_all_players(self, position: Optional[str] = None) -> pl.DataFrame:
         """
         Predict fantasy performance for all eligible players.
-        
+
+        Args:
+            position: Optional position (e.g. "QB") to restrict predictions to.
+                Filtering here skips the prediction work for other positions
+                entirely instead of discarding it afterwards.
+
         Returns:
             DataFrame with predictions sorted by predicted season FP
         """
         logger.info("Loading and processing player statistics...")
-        df = self.load_player_stats()
-        
-        logger.info("Calculating seasonal statistics...")
-        seasonal_df = self.get_player_seasonal_stats(df)
-        
-        # Filter to players with minimum seasons played
+        seasonal_df = self._load_seasonal_cached()
+
+        # Eligibility is expressed as window filters so no player-id lists
+        # round-trip through Python
         min_seasons = self.config["prediction"].get("min_seasons_played", 2)
-        player_season_counts = seasonal_df.group_by("player_id").agg([
-            pl.count().alias("season_count")
-        ])
-        
-        eligible_players = player_season_counts.filter(
-            pl.col("season_count") >= min_seasons
-        )["player_id"].to_list()
-        
-        # Filter by position if specified
+        eligible = seasonal_df.lazy().filter(
+            pl.len().over("player_id") >= min_seasons
+        )
+
         position_filters = self.config["prediction"].get("position_filters", {})
         if any(position_filters.values()):
             allowed_positions = [
                 pos for pos, enabled in position_filters.items() if enabled
             ]
-            eligible_players = seasonal_df.filter(
-                (pl.col("player_id").is_in(eligible_players))
-                & (pl.col("position").is_in(allowed_positions))
-            )["player_id"].unique().to_list()
-        
-        logger.info(f"Predicting for {len(eligible_players)} eligible players...")
-        
-        predictions = []
-        for player_id in eligible_players:
-            try:
-                prediction = self.predict_player_2026(seasonal_df, player_id)
-                if prediction:
-                    predictions.append(prediction)
-            except Exception as e:
-                logger.warning(f"Error predicting for player {player_id}: {e}")
-                continue
-        
-        if not predictions:
-            raise ValueError("No predictions generated. Check data and filters.")
-        
-        predictions_df = pl.DataFrame(predictions)
-        
-        # Position should already be string from predict_player_2026, but ensure it
-        # Convert any remaining lists or ensure it's Utf8 type
-        if "position" in predictions_df.columns:
-            # First try to cast directly, if that fails, use map_elements
-            try:
-                predictions_df = predictions_df.with_columns(
-                    pl.col("position").cast(pl.Utf8).alias("position")
+            eligible = eligible.filter(
+                pl.col("position").is_in(allowed_positions).any().over("player_id")
+            )
+
+        # Restrict to the requested position before predicting anything
+        if position:
+            eligible = eligible.filter(
+                (pl.col("position") == position.upper()).any().over("player_id")
+            )
+
+        eligible = eligible.collect()
+        logger.info(
+            f"Predicting for {eligible['player_id'].n_unique()} eligible players..."
+        )
+
+        # The whole prediction - weighted recent average, linear trend, and
+        # consistency bonus - is computed for every player at once in native
+        # polars kernels instead of re-filtering the seasonal frame per
+        # player in a Python loop. One group_by produces all three families
+        # of aggregates, so the frame is scanned a single time.
+        valid_fp = (
+            pl.col("avg_fp_per_game").is_not_null()
+            & pl.col("avg_fp_per_game").is_not_nan()
+        )
+        valid_consistency = (
+            pl.col("consistency_score").is_not_null()
+            & pl.col("consistency_score").is_not_nan()
+        )
+        is_recent = pl.col("season") >= self.target_season - 3
+        recent_valid_fp = pl.col("avg_fp_per_game").filter(is_recent & valid_fp)
+
+        # Weights grow 1.0, 1.3, 1.6, ... in season order (rows are sorted by
+        # season within each player), so the most recent season weighs most;
+        # cum_count is 1-based, hence 0.7 + 0.3k
+        season_weight = recent_valid_fp.cum_count() * 0.3 + 0.7
+
+        per_player = (
+            eligible.lazy()
+            .group_by("player_id")
+            .agg(
+                pl.col("player_name").first(),
+                pl.col("position").first(),
+                # Weighted average over valid recent seasons
+                (
+                    (recent_valid_fp * season_weight).sum() / season_weight.sum()
+                ).alias("weighted_avg"),
+                recent_valid_fp.mean().alias("recent_avg_fp"),
+                pl.col("consistency_score")
+                .filter(is_recent & valid_consistency)
+                .mean()
+                .alias("consistency_score"),
+                is_recent.sum().cast(pl.Int64).alias("seasons_analyzed"),
+                pl.col("season").filter(is_recent).max().alias("last_season"),
+                # Closed-form least-squares inputs over every valid season -
+                # the same regression calculate_trend runs
+                valid_fp.sum().alias("n"),
+                pl.col("season").filter(valid_fp).sum().alias("sum_x"),
+                pl.col("avg_fp_per_game").filter(valid_fp).sum().alias("sum_y"),
+                (pl.col("season") * pl.col("avg_fp_per_game"))
+                .filter(valid_fp)
+                .sum()
+                .alias("sum_xy"),
+                (pl.col("season") * pl.col("season"))
+                .filter(valid_fp)
+                .sum()
+                .alias("sum_x2"),
+            )
+        )
+
+        trend_weight = self.config["prediction"].get("trend_weight", 0.3)
+        consistency_weight = self.config["prediction"].get("consistency_weight", 0.2)
+
+        predictions_df = (
+            per_player
+            # Players without a valid recent season have no projection. The
+            # weighted average is NaN (0/0) when every season falls outside
+            # the recent window, so NaN must be excluded alongside null to
+            # match predict_player_2026 returning None for those players.
+            .filter(
+                pl.col("weighted_avg").is_not_null()
+                & pl.col("weighted_avg").is_not_nan()
+            )
+            .with_columns(
+                pl.when(
+                    (pl.col("n") >= 2)
+                    & ((pl.col("n") * pl.col("sum_x2") - pl.col("sum_x") ** 2) != 0)
                 )
-            except Exception:
-                # If cast fails (e.g., because of lists), use map_elements
-                predictions_df = predictions_df.with_columns([
-                    pl.col("position").map_elements(
-                        lambda pos: (
-                            pos[0] if isinstance(pos, list) and pos 
-                            else (str(pos) if pos is not None else "UNK")
-                        ),
-                        return_dtype=pl.Utf8
-                    ).alias("position")
-                ])
-        
-        predictions_df = predictions_df.sort("predicted_season_fp", descending=True)
+                .then(
+                    (pl.col("n") * pl.col("sum_xy") - pl.col("sum_x") * pl.col("sum_y"))
+                    / (pl.col("n") * pl.col("sum_x2") - pl.col("sum_x") ** 2)
+                )
+                .otherwise(0.0)
+                .alias("trend"),
+                pl.col("consistency_score").fill_null(0.5),
+            )
+            .with_columns(
+                pl.max_horizontal(
+                    0.0,
+                    pl.col("weighted_avg")
+                    + pl.col("trend") * trend_weight
+                    + (pl.col("consistency_score") - 0.5) * consistency_weight,
+                ).alias("predicted_avg_fp_per_game")
+            )
+            .select(
+                # Output dtypes pinned explicitly: the Float32 fantasy_points
+                # column would otherwise leak its precision into the
+                # prediction columns via the aggregation chain
+                pl.col("player_id"),
+                pl.col("player_name"),
+                pl.col("position"),
+                pl.col("predicted_avg_fp_per_game").cast(pl.Float64).round(2),
+                (pl.col("predicted_avg_fp_per_game") * 17)
+                .cast(pl.Float64)
+                .round(2)
+                .alias("predicted_season_fp"),
+                pl.col("recent_avg_fp").cast(pl.Float64).round(2),
+                pl.col("trend").cast(pl.Float64).round(3),
+                pl.col("consistency_score").cast(pl.Float64).round(3),
+                pl.col("seasons_analyzed"),
+                pl.col("last_season"),
+            )
+        )
+
+        # The eligibility pushdown keeps any player who has *ever* played the
+        # requested position; drop the ones whose current (labelled) position
+        # differs so every output row satisfies position == requested, as the
+        # pre-pushdown post-filter guaranteed. Cheap: post-group cardinality.
+        if position:
+            predictions_df = predictions_df.filter(
+                pl.col("position") == position.upper()
+            )
+
+        predictions_df = predictions_df.collect()
+
+        # An empty frame for a requested position is a normal outcome the
+        # callers already handle ("No players found..."); only a completely
+        # empty prediction set signals broken data/filters
+        if predictions_df.height == 0 and position is None:
+            raise ValueError("No predictions generated. Check data and filters.")
         
+        # Record the sort order on the column so downstream head/filter/top-N
+        # calls can take polars' sorted fast paths
+        predictions_df = predictions_df.sort(
+            "predicted_season_fp", descending=True
+        ).set_sorted("predicted_season_fp", descending=True)
+
         return predictions_df
     
+    def _prediction_signature(self, predictions_df: pl.DataFrame) -> str:
+        """
+        Fingerprint the prediction inputs (source data mtime + config) and
+        the output shape.
+
+        Used to skip rewriting the output file when nothing that feeds the
+        predictions has changed since the last save.
+        """
+        stats_path = self.data_dir / "player_stats" / "player_stats.parquet"
+        try:
+            source_mtime = stats_path.stat().st_mtime_ns
+        except OSError:
+            source_mtime = 0
+
+        # The player-id set distinguishes outputs that happen to share a row
+        # count (e.g. equal-sized position filters)
+        player_ids = ",".join(sorted(predictions_df.get_column("player_id").to_list())) \
+            if "player_id" in predictions_df.columns else ""
+        payload = (
+            f"{source_mtime}|{predictions_df.height}|{predictions_df.columns}|{player_ids}"
+            f"|{json.dumps(self.config, sort_keys=True, default=str)}"
+        )
+        return hashlib.blake2b(payload.encode(), digest_size=16).hexdigest()
+
     def save_predictions(self, predictions_df: pl.DataFrame) -> Path:
         """
         Save predictions to file.
-        
+
         Args:
             predictions_df: DataFrame with predictions
-            
+
         Returns:
             Path to saved file
         """
         output_dir = Path(self.config["output"]["directory"])
         output_dir.mkdir(parents=True, exist_ok=True)
-        
+
         output_format = self.config["output"].get("format", "parquet")
         output_path = output_dir / f"predictions_2026.{output_format}"
-        
+
+        # Skip the write entirely when inputs are unchanged since the last
+        # save - the sidecar .sig records the input fingerprint
+        sig = self._prediction_signature(predictions_df)
+        sig_path = output_path.with_suffix(output_path.suffix + ".sig")
+        if output_path.exists() and sig_path.exists():
+            if sig_path.read_text() == sig:
+                logger.info(f"Predictions unchanged, keeping {output_path}")
+                return output_path
+
         if output_format == "parquet":
-            predictions_df.write_parquet(output_path)
+            # zstd + statistics: prediction frames repeat positions and names
+            # heavily, so dictionary-backed zstd shrinks them several-fold
+            predictions_df.write_parquet(
+                output_path, compression="zstd", compression_level=3, statistics=True
+            )
         elif output_format == "csv":
             predictions_df.write_csv(output_path)
+        elif output_format in ("arrow", "ipc", "feather"):
+            # Arrow IPC: same-machine consumers mmap the buffers back with
+            # zero decode cost, unlike the parquet round-trip
+            predictions_df.write_ipc(output_path)
         else:
             predictions_df.write_json(output_path)
-        
+
+        sig_path.write_text(sig)
         logger.info(f"Saved predictions to {output_path}")
         return output_path
     
@@ -369,6 +587,11 @@ class FantasyPredictor:
         """
         if n is None:
             n = self.config["output"].get("top_n_players", 50)
-        
-        return predictions_df.head(n)
+
+        # top_k is O(N log k) vs O(N log N) for a full sort, and also returns
+        # the true top N when handed an unsorted (e.g. freshly filtered)
+        # frame; the final small sort keeps display order stable
+        return predictions_df.top_k(n, by="predicted_season_fp").sort(
+            "predicted_season_fp", descending=True
+        )
 
@@ -16,9 +16,13 @@ def temp_dir():
         yield Path(tmpdir)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_config() -> Dict:
-    """Sample configuration dictionary for testing."""
+    """Sample configuration dictionary for testing.
+
+    Session-scoped: tests treat it as read-only; anything needing a mutated
+    variant builds its own dict (see the disabled-dataset tests).
+    """
     return {
         "seasons": {
             "start_year": 2020,
@@ -64,18 +68,22 @@ def sample_config() -> Dict:
     }
 
 
-@pytest.fixture
-def config_file(temp_dir, sample_config):
-    """Create a temporary config file."""
-    config_path = temp_dir / "test_config.json"
-    with open(config_path, "w") as f:
-        json.dump(sample_config, f, indent=2)
+@pytest.fixture(scope="session")
+def config_file(tmp_path_factory, sample_config):
+    """Write the baseline config to disk once per test session."""
+    config_path = tmp_path_factory.mktemp("config") / "test_config.json"
+    # Serialize to bytes in one shot; write_bytes is a single open/write
+    config_path.write_bytes(json.dumps(sample_config, indent=2).encode())
     return config_path
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_polars_df():
-    """Create a sample Polars DataFrame for testing."""
+    """Create a sample Polars DataFrame for testing.
+
+    Session-scoped: every consumer only reads it (saves/merges), so the
+    Arrow buffers are allocated once for the whole run.
+    """
     return pl.DataFrame(
         {
             "player_id": ["123", "456", "789"],
@@ -99,52 +107,39 @@ def sample_pandas_df():
     )
 
 
-@pytest.fixture
-def mock_nflreadpy(monkeypatch):
-    """Mock nflreadpy functions for testing."""
-    mock_data = pl.DataFrame(
-        {
-            "player_id": ["123", "456"],
-            "player_name": ["Test Player 1", "Test Player 2"],
-            "season": [2022, 2022],
-        }
-    )
-
-    def mock_load_player_stats(seasons):
-        return mock_data
-
-    def mock_load_rosters(seasons):
-        return mock_data
+# Stateless nflreadpy stand-in built once at collection time; the fixture
+# only patches it in per test instead of rebuilding the whole mock tree
+_MOCK_NFL_DATA = pl.DataFrame(
+    {
+        "player_id": ["123", "456"],
+        "player_name": ["Test Player 1", "Test Player 2"],
+        "season": [2022, 2022],
+    }
+)
 
-    def mock_load_schedules(seasons):
-        return mock_data
 
-    def mock_load_injuries(seasons):
-        return mock_data
+def _mock_load(seasons=None):
+    # One loader body serves every dataset; load_contracts passes no seasons
+    return _MOCK_NFL_DATA
 
-    def mock_load_draft_picks(seasons):
-        return mock_data
 
-    def mock_load_contracts(seasons):
-        return mock_data
+class MockNFL:
+    load_player_stats = staticmethod(_mock_load)
+    load_rosters = staticmethod(_mock_load)
+    load_schedules = staticmethod(_mock_load)
+    load_injuries = staticmethod(_mock_load)
+    load_draft_picks = staticmethod(_mock_load)
+    load_contracts = staticmethod(_mock_load)
+    load_pbp = staticmethod(_mock_load)
+    load_team_stats = staticmethod(_mock_load)
 
-    def mock_load_pbp(seasons):
-        return mock_data
 
-    def mock_load_team_stats(seasons):
-        return mock_data
+_MOCK_NFL = MockNFL()
 
-    # Create a mock nfl module
-    class MockNFL:
-        load_player_stats = staticmethod(mock_load_player_stats)
-        load_rosters = staticmethod(mock_load_rosters)
-        load_schedules = staticmethod(mock_load_schedules)
-        load_injuries = staticmethod(mock_load_injuries)
-        load_draft_picks = staticmethod(mock_load_draft_picks)
-        load_contracts = staticmethod(mock_load_contracts)
-        load_pbp = staticmethod(mock_load_pbp)
-        load_team_stats = staticmethod(mock_load_team_stats)
 
-    monkeypatch.setattr("pwn_fantasy_football.data_fetch.data_fetcher.nfl", MockNFL())
+@pytest.fixture
+def mock_nflreadpy(monkeypatch):
+    """Patch nflreadpy with the shared stateless mock module."""
+    monkeypatch.setattr("pwn_fantasy_football.data_fetch.data_fetcher.nfl", _MOCK_NFL)
     return MockNFL
 
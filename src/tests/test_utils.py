@@ -1,7 +1,9 @@
 """Tests for utility functions in data_fetch.utils."""
 
 import json
+import re
 import tempfile
+from io import BytesIO
 from pathlib import Path
 from datetime import datetime
 import pytest
@@ -16,6 +18,10 @@ from pwn_fantasy_football.data_fetch.utils import (
     merge_dataframes,
 )
 
+# Expected-error patterns compiled once for the pytest.raises matches
+UNSUPPORTED_FORMAT = re.compile("Unsupported format")
+NO_DATAFRAMES = re.compile("No DataFrames provided")
+
 
 class TestEnsureDirectory:
     """Tests for ensure_directory function."""
@@ -71,6 +77,20 @@ class TestSaveDataframe:
         assert df_read.shape == sample_polars_df.shape
         assert df_read.columns == sample_polars_df.columns
 
+    @pytest.mark.parametrize("format,reader", [
+        ("parquet", pl.read_parquet),
+        ("csv", pl.read_csv),
+        ("json", pl.read_json),
+    ])
+    def test_save_to_buffer_round_trip(self, sample_polars_df, format, reader):
+        """Round-trip through an in-memory buffer, skipping the filesystem."""
+        buffer = BytesIO()
+        save_dataframe(sample_polars_df, buffer, format=format)
+        buffer.seek(0)
+        
+        df_read = reader(buffer)
+        assert df_read.shape == sample_polars_df.shape
+
     def test_save_pandas_parquet(self, temp_dir, sample_pandas_df):
         """Test saving Pandas DataFrame as Parquet."""
         output_path = temp_dir / "test_pandas.parquet"
@@ -110,9 +130,18 @@ class TestSaveDataframe:
         """Test that invalid format raises error."""
         output_path = temp_dir / "test.invalid"
         
-        with pytest.raises(ValueError, match="Unsupported format"):
+        with pytest.raises(ValueError, match=UNSUPPORTED_FORMAT):
             save_dataframe(sample_polars_df, output_path, format="invalid")
 
+    def test_streaming_write(self, temp_dir, sample_polars_df):
+        """Test forcing the streaming parquet sink on a small frame."""
+        output_path = temp_dir / "test_streamed.parquet"
+        save_dataframe(sample_polars_df, output_path, streaming=True)
+
+        assert output_path.exists()
+        df_read = pl.read_parquet(output_path)
+        assert df_read.shape == sample_polars_df.shape
+
     def test_compression_parameter(self, temp_dir, sample_polars_df):
         """Test that compression parameter is accepted."""
         output_path = temp_dir / "test_compressed.parquet"
@@ -233,7 +262,7 @@ class TestMergeDataframes:
 
     def test_merge_empty_list(self):
         """Test merging empty list raises error."""
-        with pytest.raises(ValueError, match="No DataFrames provided"):
+        with pytest.raises(ValueError, match=NO_DATAFRAMES):
             merge_dataframes([])
 
     def test_merge_multiple_dataframes(self, sample_polars_df):